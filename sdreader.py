@@ -1,31 +1,88 @@
-from dataclasses import dataclass, field
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+import csv
+import ctypes
+import ctypes.util
+import errno
+import functools
+import logging
+import logging.handlers
+from dataclasses import dataclass, field, replace
 import os
 import shutil
 import subprocess
+import sys
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 import threading
+import time
 import signal
-import itertools
 from urllib.request import urlopen
 import tkinter.messagebox as messagebox
 import plistlib
 
+try:
+    import posix
+except ImportError:
+    posix = None
+
+# Resolve the platform once instead of calling os.uname() on every check
+_IS_MAC = os.name == "posix" and sys.platform == "darwin"
+_IS_LINUX = os.name == "posix" and not _IS_MAC
+_IS_WIN = os.name == "nt"
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+GIF_URL = "https://media.giphy.com/media/3oEjI6SIIHBdRxXI40/giphy.gif"
+GIF_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "sdreader", "giphy.gif")
+gif_downloaded = threading.Event()
+
+WINDOW_WIDTH = 800
+WINDOW_HEIGHT = 600
+
+# shutil's default chunk size is tuned for small files, SD cards are mostly large media
+shutil.COPY_BUFSIZE = 1 << 20
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
 
 def bytes_to_human_readable(num_bytes):
     """
     Convert bytes to a human-readable string (e.g., KB, MB, GB).
     """
-    step_unit = 1024
-    units = ["B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"]
+    if num_bytes <= 0:
+        return "0.00 B"
+    # Each unit is 2**10 of the previous one, so the unit index falls out of the bit length
+    unit = min(len(_UNITS) - 1, (int(num_bytes).bit_length() - 1) // 10)
+    return f"{num_bytes / (1 << (10 * unit)):.2f} {_UNITS[unit]}"
 
-    for unit in units:
-        if num_bytes < step_unit:
-            return f"{num_bytes:.2f} {unit}"
-        num_bytes /= step_unit
 
-    return f"{num_bytes:.2f} YB"  # In case the number is extremely large
+@dataclass
+class Progress:
+    """
+    Files done out of files found, summed over all cards being copied.
+    Cards copy in parallel, so updates go through a lock.
+    """
+
+    var: tk.IntVar
+    done: int = 0
+    total: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, done=0, total=0):
+        with self.lock:
+            self.done += done
+            self.total += total
+
+    def reset(self):
+        with self.lock:
+            self.done = 0
+            self.total = 0
+
+    def percent(self):
+        with self.lock:
+            return min(100, self.done * 100 // self.total) if self.total else 0
 
 
 @dataclass
@@ -37,38 +94,194 @@ class Context:
     gif_frames: list = field(default_factory=list)
     stop_animation: threading.Event = None
     activity_label: ttk.Label = None
+    max_workers: int = 5
+    native_copy: bool = False
+    progress: Progress = None
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also flushes when a record arrives and the oldest
+    buffered one is at least `interval` seconds old, so output keeps up
+    with a long copy.
+    """
+
+    def __init__(self, capacity, interval=0.5, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.interval = interval
+
+    def shouldFlush(self, record):
+        return super().shouldFlush(record) or record.created - self.buffer[0].created >= self.interval
 
 
-def plog(message):
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
+log = logging.getLogger("sdreader")
+log.setLevel(logging.INFO)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+# Buffer records so the copy loop doesn't block on the terminal for every file;
+# warnings such as failed copies are shown straight away
+log_handler = _TimedMemoryHandler(1000, flushLevel=logging.WARNING, target=_stream_handler)
+log.addHandler(log_handler)
 
 
 def is_sd_card_mac(device):
-    result = subprocess.run(["diskutil", "info", device], capture_output=True, text=True)
-    for line in result.stdout.splitlines():
-        if "Media Name" in line and "SD" in line:
-            return True
-    return False
-
-
-def is_sd_card(device, mount_point):
-    if os.name == "posix":
-        if os.uname().sysname == "Darwin":
-            return is_sd_card_mac(device)
-        elif "mmcblk" in device or "sd" in device:
-            return True
-    elif os.name == "nt":
-        result = subprocess.run(
-            ["wmic", "logicaldisk", "where", f"DeviceID='{device}'", "get", "MediaType"],
-            capture_output=True,
-            text=True,
-        )
-        if "Removable Media" in result.stdout:
-            return True
-    return False
+    return device.removeprefix("/dev/") in sd_devices_mac()
+
+
+@functools.lru_cache(maxsize=None)
+def sd_devices_mac():
+    """
+    Return the set of device identifiers that belong to an SD card, using a
+    single `diskutil info -all` call instead of one per device. The result is
+    cached until get_mounts runs again.
+    """
+    is_sd = {}
+    whole_disks = {}
+    device = None
+    # Parse raw bytes as diskutil produces them; only identifiers get decoded
+    with subprocess.Popen(["diskutil", "info", "-all"], stdout=subprocess.PIPE) as proc:
+        for line in proc.stdout:
+            key, sep, value = line.partition(b":")
+            if not sep:
+                continue
+            key = key.strip()
+            value = value.strip()
+            if key == b"Device Identifier":
+                device = os.fsdecode(value)
+                is_sd.setdefault(device, False)
+            elif device is None:
+                continue
+            elif key == b"Part of Whole":
+                whole_disks[device] = os.fsdecode(value)
+            elif b"Media Name" in key:
+                # "APPLE SSD ..." contains "SD" too
+                is_sd[device] = is_sd[device] or b"SD" in value.replace(b"SSD", b"")
+            elif key == b"Protocol" and value == b"Secure Digital":
+                is_sd[device] = True
+    # A partition's media name is its volume label, so look at the disk it is part of as well
+    return frozenset(d for d in is_sd if is_sd[d] or is_sd.get(whole_disks.get(d), False))
+
+
+def _read_sysfs(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def linux_disk_name(device):
+    """
+    Return the sysfs name of the disk holding a block device (e.g. mmcblk0 for
+    /dev/mmcblk0p1), or None if the device is not a block device.
+    """
+    if not device.startswith("/dev/"):
+        return None
+    block = f"/sys/class/block/{os.path.basename(device)}"
+    if not os.path.exists(block):
+        return None
+    if os.path.exists(f"{block}/partition"):
+        return os.path.basename(os.path.dirname(os.path.realpath(block)))
+    return os.path.basename(device)
+
+
+def is_sd_card_linux(disk):
+    if disk is None:
+        return False
+    if _read_sysfs(f"/sys/block/{disk}/device/type") in ("SD", "MMC"):
+        return True
+    return _read_sysfs(f"/sys/block/{disk}/removable") == "1"
+
+
+def sd_disks_linux():
+    try:
+        disks = os.listdir("/sys/block")
+    except OSError:
+        return set()
+    return {disk for disk in disks if is_sd_card_linux(disk)}
+
+
+DRIVE_REMOVABLE = 2
+
+
+def is_sd_card_windows(device):
+    # Accepts "E", "E:" or "E:\\"
+    return ctypes.windll.kernel32.GetDriveTypeW(f"{device[0]}:\\") == DRIVE_REMOVABLE
+
+
+MNT_NOWAIT = 2
+
+
+class _Statfs(ctypes.Structure):
+    # struct statfs with 64-bit inodes, see <sys/mount.h>
+    _fields_ = [
+        ("f_bsize", ctypes.c_uint32),
+        ("f_iosize", ctypes.c_int32),
+        ("f_blocks", ctypes.c_uint64),
+        ("f_bfree", ctypes.c_uint64),
+        ("f_bavail", ctypes.c_uint64),
+        ("f_files", ctypes.c_uint64),
+        ("f_ffree", ctypes.c_uint64),
+        ("f_fsid", ctypes.c_int32 * 2),
+        ("f_owner", ctypes.c_uint32),
+        ("f_type", ctypes.c_uint32),
+        ("f_flags", ctypes.c_uint32),
+        ("f_fssubtype", ctypes.c_uint32),
+        ("f_fstypename", ctypes.c_char * 16),
+        ("f_mntonname", ctypes.c_char * 1024),
+        ("f_mntfromname", ctypes.c_char * 1024),
+        ("f_flags_ext", ctypes.c_uint32),
+        ("f_reserved", ctypes.c_uint32 * 7),
+    ]
+
+
+def getmntinfo():
+    """
+    Return the mount table as a list of statfs structs by calling getmntinfo(3)
+    directly instead of running a subprocess.
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    # Intel macs export the 64-bit inode variant under a suffixed name
+    func = getattr(libc, "getmntinfo$INODE64", None) or libc.getmntinfo
+    func.argtypes = [ctypes.POINTER(ctypes.POINTER(_Statfs)), ctypes.c_int]
+    func.restype = ctypes.c_int
+    buf = ctypes.POINTER(_Statfs)()
+    count = func(ctypes.byref(buf), MNT_NOWAIT)
+    if count <= 0:
+        raise OSError(ctypes.get_errno(), "getmntinfo failed")
+    return [buf[i] for i in range(count)]
 
 
 def read_mounts_mac():
+    try:
+        entries = getmntinfo()
+    except (OSError, AttributeError):
+        return read_mounts_mac_diskutil()
+
+    mounts = []
+    for entry in entries:
+        device = os.fsdecode(entry.f_mntfromname)
+        # Skip devfs, autofs maps and other mounts that are not backed by a disk
+        if not device.startswith("/dev/"):
+            continue
+        mount_point = os.fsdecode(entry.f_mntonname)
+        # Cards mount under /Volumes/; this also excludes /System/Volumes/ and the root volume
+        if not mount_point.startswith("/Volumes/"):
+            continue
+        device = device[len("/dev/"):]
+        mount_info = {
+            "device": device,
+            "mount_point": mount_point,
+            "filesystem_type": os.fsdecode(entry.f_fstypename),
+            "options": os.path.basename(mount_point),
+            "Size": bytes_to_human_readable(entry.f_blocks * entry.f_bsize),
+            "is_sd_card": is_sd_card_mac(device),
+        }
+        mounts.append(mount_info)
+    return mounts
+
+
+def read_mounts_mac_diskutil():
     mounts = []
     result = subprocess.run(["diskutil", "list", "-plist"], capture_output=True, text=True)
     if result.returncode != 0:
@@ -77,13 +290,13 @@ def read_mounts_mac():
     disk_info = plistlib.loads(result.stdout.encode())
     for disk in disk_info.get("AllDisksAndPartitions", []):
         for partition in disk.get("Partitions", []):
-            if partition.get("MountPoint"):
+            if partition.get("MountPoint", "").startswith("/Volumes/"):
                 mount_info = {
                     "device": partition.get("DeviceIdentifier"),
                     "mount_point": partition.get("MountPoint"),
                     "filesystem_type": partition.get("Type"),
                     "options": partition.get("VolumeName"),
-                    "is_sd_card": is_sd_card(partition.get("DeviceIdentifier"), partition.get("MountPoint")),
+                    "is_sd_card": is_sd_card_mac(partition.get("DeviceIdentifier")),
                 }
                 mounts.append(mount_info)
     return mounts
@@ -91,52 +304,97 @@ def read_mounts_mac():
 
 def read_mounts_linux():
     mounts = []
-    with open("/proc/mounts", "r") as f:
-        for line in f:
-            parts = line.split()
-            device = parts[0]
-            mount_point = parts[1]
-            mount_info = {
-                "device": device,
-                "mount_point": mount_point,
-                "filesystem_type": parts[2],
-                "options": parts[3],
-                "dump": parts[4],
-                "pass": parts[5],
-                "is_sd_card": is_sd_card(device, mount_point),
-            }
-            mounts.append(mount_info)
+    # Check sysfs once per disk up front, each mount is then a set lookup
+    sd_disks = sd_disks_linux()
+    with open("/proc/mounts", "rb") as f:
+        data = f.read()
+    for line in data.splitlines():
+        # Skip proc, sysfs, tmpfs, cgroup and other mounts that are not backed by a disk
+        # before splitting or decoding anything
+        if not line.startswith(b"/dev/"):
+            continue
+        parts = [os.fsdecode(part) for part in line.split(None, 5)]
+        device = parts[0]
+        mount_info = {
+            "device": device,
+            "mount_point": parts[1],
+            "filesystem_type": parts[2],
+            "options": parts[3],
+            "dump": parts[4],
+            "pass": parts[5],
+            "is_sd_card": bool(sd_disks) and linux_disk_name(device) in sd_disks,
+        }
+        mounts.append(mount_info)
     return mounts
 
 
 def read_mounts_windows():
+    try:
+        return read_mounts_windows_native()
+    except (OSError, AttributeError):
+        return read_mounts_windows_wmic()
+
+
+def read_mounts_windows_native():
+    """
+    Enumerate drives with kernel32 calls instead of running wmic.
+    """
+    kernel32 = ctypes.windll.kernel32
+    drive_mask = kernel32.GetLogicalDrives()
+    if not drive_mask:
+        raise ctypes.WinError()
+
+    mounts = []
+    # Bit 0 is A:, bit 1 is B: and so on
+    for letter in (chr(ord("A") + i) for i in range(26) if drive_mask & (1 << i)):
+        root_path = f"{letter}:\\"
+        volume_name = ctypes.create_unicode_buffer(261)
+        file_system = ctypes.create_unicode_buffer(261)
+        kernel32.GetVolumeInformationW(root_path, volume_name, 261, None, None, None, file_system, 261)
+        total_bytes = ctypes.c_ulonglong(0)
+        free_bytes = ctypes.c_ulonglong(0)
+        kernel32.GetDiskFreeSpaceExW(root_path, None, ctypes.byref(total_bytes), ctypes.byref(free_bytes))
+        device_id = root_path.rstrip("\\")
+        mount_info = {
+            "DeviceID": device_id,
+            "FileSystem": file_system.value,
+            "FreeSpace": str(free_bytes.value),
+            "Size": bytes_to_human_readable(total_bytes.value) if total_bytes.value else "",
+            "VolumeName": volume_name.value,
+            "is_sd_card": is_sd_card_windows(letter),
+            "mount_point": device_id,
+            "device": device_id.replace(":", ""),
+        }
+        mounts.append(mount_info)
+    return mounts
+
+
+def read_mounts_windows_wmic():
     mounts = []
     result = subprocess.run(
-        ["wmic", "logicaldisk", "get", "DeviceID,FileSystem,Size,FreeSpace,VolumeName"],
+        ["wmic", "logicaldisk", "get", "DeviceID,FileSystem,MediaType,Size,FreeSpace,VolumeName", "/format:csv"],
         capture_output=True,
         text=True,
     )
-    lines = result.stdout.splitlines()
-    keys = [key.strip() for key in lines[0].split()]
-    for line in lines[1:]:
-        if line.strip():
-            values = line.split()
-            mount_info = dict(zip(keys, values))
-            mount_info["is_sd_card"] = is_sd_card(mount_info["DeviceID"], None)
-            mount_info["mount_point"] = mount_info["DeviceID"]
-            mount_info["device"] = mount_info["DeviceID"].replace(":", "")
+    # csv keeps columns aligned when VolumeName contains spaces or a field is empty
+    for mount_info in csv.DictReader(result.stdout.strip().splitlines()):
+        # MediaType 11 is "Removable media other than floppy"
+        mount_info["is_sd_card"] = mount_info.get("MediaType") == "11"
+        mount_info["mount_point"] = mount_info["DeviceID"]
+        mount_info["device"] = mount_info["DeviceID"].replace(":", "")
+        if mount_info.get("Size"):
             mount_info["Size"] = bytes_to_human_readable(int(mount_info["Size"]))
-            mounts.append(mount_info)
+        mounts.append(mount_info)
     return mounts
 
 
 def get_mounts():
-    if os.name == "posix":
-        if os.uname().sysname == "Darwin":
-            return read_mounts_mac()
-        else:
-            return read_mounts_linux()
-    elif os.name == "nt":
+    if _IS_MAC:
+        sd_devices_mac.cache_clear()
+        return read_mounts_mac()
+    elif _IS_LINUX:
+        return read_mounts_linux()
+    elif _IS_WIN:
         return read_mounts_windows()
     return []
 
@@ -147,80 +405,419 @@ def write_selected_mounts(selected_mounts, filename="selected_mounts.txt"):
             f.write(f"{mount}\n")
 
 
-def copy_sd_card_contents(ctx: Context):
-    print(f"copy_sd_card_contents: {ctx.root=}")
-    if not os.path.exists(ctx.base_destination):
-        os.makedirs(ctx.base_destination)
-    print(f"Copying files from {ctx.mount_point} to {ctx.base_destination}")
-    for root, dirs, files in os.walk(ctx.mount_point):
-        relative_path = os.path.relpath(root, ctx.mount_point)
-
-        dest_path = os.path.join(ctx.base_destination, relative_path)
-        print(f"{ctx=}, {relative_path=}, {dest_path=}")
-        if not os.path.exists(dest_path):
-            os.makedirs(dest_path)
-        for file in files:
-            src_file = os.path.join(root, file)
-            dest_file = os.path.join(dest_path, file)
+def _scan(path):
+    """
+    Walk a directory tree like os.walk, but yield DirEntry objects so callers
+    can use the type and stat information cached by os.scandir. Clearing the
+    yielded dirs list skips those subdirectories, as with os.walk.
+    """
+    # An explicit stack avoids a chain of nested generators on deep trees
+    stack = [path]
+    while stack:
+        path = stack.pop()
+        dirs = []
+        files = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry)
+        except OSError as e:
+            # Like os.walk, skip unreadable directories instead of abandoning the rest of the tree
+            log.warning("Cannot read directory %s: %s", path, e)
+            continue
+        yield path, dirs, files
+        stack.extend(d.path for d in reversed(dirs))
+
+
+# Cleared the first time the kernel refuses copy_file_range. The card and the destination are
+# different filesystems, and most kernels reject that with EXDEV on every call
+_use_copy_file_range = hasattr(os, "copy_file_range")
+
+
+def _kernel_copy(src_fd, dst_fd, size):
+    """
+    Copy size bytes between two file descriptors without going through user
+    space. Returns the number of bytes copied, which is short only if the
+    source ended early.
+    """
+    global _use_copy_file_range
+    offset = 0
+    # copy_file_range copies the whole file in-kernel, usually in a single call
+    copy_range = _use_copy_file_range
+    while offset < size:
+        if copy_range:
+            try:
+                sent = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+                _use_copy_file_range = copy_range = False
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                continue
+            if sent == 0 and offset == 0:
+                # Some filesystems return 0 without copying anything, retry with sendfile like shutil does
+                copy_range = False
+                continue
+        else:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def _sendfile_copy(src, dst, size=None):
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            if size is None:
+                size = os.fstat(src_fd).st_size
+            if _HAS_FADVISE:
+                # Ask for aggressive readahead on the card
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            copied = _kernel_copy(src_fd, dst_fd, size)
+            if copied < size:
+                # Fail instead of time-stamping a truncated copy and reporting it as copied
+                raise OSError(errno.EIO, f"Copied only {copied} of {size} bytes", src)
+            if _HAS_FADVISE:
+                # The copy won't be read back, don't let it push the GUI out of the page cache
+                os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_times(src, dst, src_stat=None):
+    # Card contents only need their timestamps, so skip copystat's chmod/chflags/xattr calls
+    if src_stat is None:
+        src_stat = os.stat(src)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+_copy_buffers = threading.local()
+
+
+def _buffered_copy(src, dst, src_stat=None):
+    # Each copy thread reuses one buffer for all its files instead of allocating per chunk
+    mv = getattr(_copy_buffers, "mv", None)
+    if mv is None:
+        mv = _copy_buffers.mv = memoryview(bytearray(shutil.COPY_BUFSIZE))
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        while True:
+            n = fsrc.readinto(mv)
+            if not n:
+                break
+            fdst.write(mv[:n] if n < len(mv) else mv)
+    _copy_times(src, dst, src_stat)
+
+
+def _fastcopy(src, dst, src_stat=None):
+    """
+    Copy a file with the platform's in-kernel copy (sendfile, fcopyfile or
+    CopyFileExW), falling back to a buffered read/write loop if that is not possible.
+    Pass the source stat if it is already known to save stat calls.
+    """
+    size = src_stat.st_size if src_stat is not None else None
+    try:
+        if size == 0:
+            open(dst, "wb").close()
+        elif _IS_WIN:
+            if not ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+                raise ctypes.WinError()
+            return
+        elif _IS_MAC:
+            if posix is None or not hasattr(posix, "_fcopyfile"):
+                raise OSError("fcopyfile not available")
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                posix._fcopyfile(fsrc.fileno(), fdst.fileno(), posix._COPYFILE_DATA)
+        else:
+            _sendfile_copy(src, dst, size)
+        _copy_times(src, dst, src_stat)
+    except PermissionError:
+        raise
+    except OSError:
+        _buffered_copy(src, dst, src_stat)
+
+
+def _is_already_copied(src_stat, dest_file):
+    try:
+        dest_stat = os.stat(dest_file)
+    except OSError:
+        # Missing, or something in the way that the copy itself will report
+        return False
+    # FAT destinations round mtimes to 2 seconds, so allow that much drift
+    return dest_stat.st_size == src_stat.st_size and abs(dest_stat.st_mtime - src_stat.st_mtime) < 2
+
+
+def _dir_root(path):
+    # os.path.join("E:", "") is still "E:", the drive's current directory, so add the separator by hand
+    return path.rstrip(os.sep) + os.sep
+
+
+def _count_files(path):
+    return sum(len(files) for _, _, files in _scan(path))
+
+
+def _add_progress(ctx: Context, done=0, total=0):
+    if ctx.progress is not None:
+        ctx.progress.add(done, total)
+
+
+def _show_progress(ctx: Context):
+    if ctx.progress is not None:
+        ctx.root.after(0, ctx.progress.var.set, ctx.progress.percent())
+
+
+def _stat_if_changed(entry, dest_file):
+    """
+    Return the stat of a file that needs copying, or None if it can't be read
+    or dest_file is already an up to date copy.
+    """
+    try:
+        src_stat = entry.stat()
+    except OSError as e:
+        log.warning("Cannot stat %s: %s", entry.path, e)
+        return None
+    # Re-runs over the same card only copy what is new or changed
+    if _is_already_copied(src_stat, dest_file):
+        log.debug("Skipping unchanged %s", entry.path)
+        return None
+    return src_stat
+
+
+def _copy_pairs(src_root, dest_root):
+    """
+    Yield a (DirEntry, destination path) pair for every file under src_root,
+    creating destination directories as they are reached. src_root must end
+    with a path separator.
+    """
+    sep = os.sep
+    for root, dirs, files in _scan(src_root):
+        # Every directory path starts with src_root, so a slice is enough to get the relative part
+        relative_path = root[len(src_root):]
+        if relative_path:
+            dest_path = os.path.join(dest_root, relative_path)
             try:
-                shutil.copy2(src_file, dest_file)
-                plog(f"Copied {src_file} to {dest_file}")
-                ctx.current_file_var.set(f"Copying: {src_file}")
-                ctx.root.update_idletasks()  # Refresh the UI
+                os.makedirs(dest_path, exist_ok=True)
+            except OSError as e:
+                # e.g. a file with the directory's name in the destination; skip this subtree, copy the rest
+                log.warning("Cannot create %s, skipping %s: %s", dest_path, root, e)
+                dirs.clear()
+                continue
+        else:
+            dest_path = dest_root
+        for entry in files:
+            yield entry, f"{dest_path}{sep}{entry.name}"
 
-            except PermissionError:
-                plog(f"Permission denied: {src_file}")
+
+def copy_sd_card_contents(ctx: Context):
+    os.makedirs(ctx.base_destination, exist_ok=True)
+    log.info(f"Copying files from {ctx.mount_point} to {ctx.base_destination}")
+    pairs = _copy_pairs(_dir_root(ctx.mount_point), ctx.base_destination)
+    if ctx.progress is not None:
+        # Scan the card once up front for the total, the copy then iterates the cached entries
+        pairs = list(pairs)
+        _add_progress(ctx, total=len(pairs))
+    last_ui = time.monotonic()
+
+    def finish(future, src_file, dest_file):
+        nonlocal last_ui
+        _add_progress(ctx, done=1)
+        try:
+            future.result()
+            log.info("Copied %s to %s", src_file, dest_file)
+            # Tk is not thread-safe, hand the update to the mainloop at most ~10 times a second
+            now = time.monotonic()
+            if now - last_ui > 0.1:
+                last_ui = now
+                ctx.root.after(0, ctx.current_file_var.set, f"Copying: {src_file}")
+                _show_progress(ctx)
+        except OSError as e:
+            # Like copytree, keep going past unreadable files (permissions, bad sectors) and report them
+            log.warning("Failed to copy %s: %s", src_file, e)
+
+    # Keep the pool small: too many concurrent readers make the SD card thrash
+    with ThreadPoolExecutor(max_workers=ctx.max_workers) as ex:
+        # Files stream into the pool across directory boundaries; cap how many wait in the queue
+        pending = {}
+        for entry, dest_file in pairs:
+            src_file = entry.path
+            src_stat = _stat_if_changed(entry, dest_file)
+            if src_stat is None:
+                _add_progress(ctx, done=1)
                 continue
+            pending[ex.submit(_fastcopy, src_file, dest_file, src_stat)] = (src_file, dest_file)
+            if len(pending) >= ctx.max_workers * 4:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(future, *pending.pop(future))
+        for future in as_completed(pending):
+            finish(future, *pending[future])
+    _show_progress(ctx)
+
+
+def _native_copy_command(src, dst):
+    if _IS_WIN:
+        # robocopy exit codes 0-7 mean success, 8 and above mean at least one failure
+        return ["robocopy", _dir_root(src), dst, "/E", "/MT:8", "/R:1", "/W:1"], 8
+    if _IS_MAC:
+        return ["ditto", src, dst], 1
+    # -u leaves files that are already up to date in the destination alone on re-runs
+    return ["cp", "-a", "-u", "--reflink=auto", os.path.join(src, "."), dst], 1
+
+
+def _report_native_progress(ctx: Context, done: threading.Event, counted: dict):
+    # counted records what this card added to ctx.progress so the caller can settle it afterwards
+    if ctx.progress is not None:
+        counted["total"] = _count_files(_dir_root(ctx.mount_point))
+        _add_progress(ctx, total=counted["total"])
+    while not done.wait(0.5):
+        copied = _count_files(ctx.base_destination)
+        ctx.root.after(0, ctx.current_file_var.set, f"Copying: {copied} files copied from {ctx.mount_point}")
+        if ctx.progress is not None:
+            copied = min(copied, counted["total"])
+            _add_progress(ctx, done=copied - counted["done"])
+            counted["done"] = copied
+            _show_progress(ctx)
+
+
+def copy_sd_card_contents_fast(ctx: Context):
+    """
+    Copy a card with the platform's own recursive copy tool (cp, ditto or
+    robocopy). Falls back to copy_sd_card_contents if the tool is missing or fails.
+    """
+    os.makedirs(ctx.base_destination, exist_ok=True)
+    command, failure_code = _native_copy_command(ctx.mount_point, ctx.base_destination)
+    log.info(f"Running {' '.join(command)}")
+    done = threading.Event()
+    counted = {"done": 0, "total": 0}
+    reporter = threading.Thread(target=_report_native_progress, args=(ctx, done, counted), daemon=True)
+    reporter.start()
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except OSError as e:
+        log.info(f"{command[0]} not available: {e}")
+        result = None
+    finally:
+        done.set()
+        reporter.join()
+    if result is None or result.returncode >= failure_code:
+        if result is not None:
+            log.warning(f"{command[0]} failed with exit code {result.returncode}: {result.stderr.strip()}")
+        # The Python copy counts this card again from scratch
+        _add_progress(ctx, done=-counted["done"], total=-counted["total"])
+        copy_sd_card_contents(ctx)
+    else:
+        _add_progress(ctx, done=counted["total"] - counted["done"])
+        _show_progress(ctx)
 
 
 def format_sd_card(device):
-    if os.name == "posix":
-        if os.uname().sysname == "Darwin":
-            # macOS: Use diskutil to erase the disk
-            plog(f"Formatting {device} on macOS")
-            subprocess.run(["diskutil", "eraseDisk", "JHFS+", "SDCard", device])
-        else:
-            # Linux: Use mkfs to format the disk
-            plog(f"Formatting {device} on Linux")
-            subprocess.run(["mkfs.ext4", device])
-    elif os.name == "nt":
+    if _IS_MAC:
+        # macOS: Use diskutil to erase the disk
+        log.info(f"Formatting {device} on macOS")
+        subprocess.run(["diskutil", "eraseDisk", "JHFS+", "SDCard", device])
+    elif _IS_LINUX:
+        # Linux: Use mkfs to format the disk
+        log.info(f"Formatting {device} on Linux")
+        subprocess.run(["mkfs.ext4", device])
+    elif _IS_WIN:
         # Windows: Use format command
-        plog(f"Formatting {device} on Windows")
+        log.info(f"Formatting {device} on Windows")
         subprocess.run(["format", device, "/FS:NTFS", "/P:1"], input=b"Y\n", text=True)
 
 
 def copy_files(ctx: Context, selected_mounts: list):
-    for i, mount_point in enumerate(selected_mounts):
-        mount_name = os.path.basename(mount_point.strip("/"))
-        ctx.base_destination = os.path.join(ctx.base_destination, f"{mount_name}_{i}")
-        ctx.mount_point = mount_point
-        # print(ctx)
-        # raise SystemExit
-        copy_sd_card_contents(ctx)
-    ctx.activity_label.config(image="")
+    copy_card = copy_sd_card_contents_fast if ctx.native_copy else copy_sd_card_contents
+    if ctx.progress is not None:
+        ctx.progress.reset()
+        ctx.root.after(0, ctx.progress.var.set, 0)
+    # Each card is its own device, so drain them in parallel with one context per card
+    with ThreadPoolExecutor(max_workers=min(8, len(selected_mounts))) as ex:
+        futures = {}
+        for i, mount_point in enumerate(selected_mounts):
+            mount_name = os.path.basename(mount_point.strip("/"))
+            mount_ctx = replace(
+                ctx,
+                mount_point=mount_point,
+                base_destination=os.path.join(ctx.base_destination, f"{mount_name}_{i}"),
+            )
+            futures[ex.submit(copy_card, mount_ctx)] = mount_point
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                log.exception(f"Copying {futures[future]} failed")
+    log_handler.flush()
+    if ctx.progress is not None:
+        ctx.root.after(0, ctx.progress.var.set, 100)
     ctx.stop_animation.set()
-    ctx.current_file_var.set("Done copying !")
-    ctx.root.update_idletasks()
+    ctx.root.after(0, ctx.current_file_var.set, "Done copying !")
 
 
-def get_gif_frames():
-    gif_url = "https://media.giphy.com/media/3oEjI6SIIHBdRxXI40/giphy.gif"
-    response = urlopen(gif_url)
-    gif_data = response.read()
-    gif_image = tk.PhotoImage(data=gif_data)
+def _download_and_cache_gif():
+    try:
+        gif_data = urlopen(GIF_URL).read()
+        os.makedirs(os.path.dirname(GIF_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{GIF_CACHE_PATH}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(gif_data)
+        os.replace(tmp_path, GIF_CACHE_PATH)
+    except OSError as e:
+        log.warning(f"Could not download activity gif: {e}")
+    finally:
+        gif_downloaded.set()
+
+
+def load_gif_frames(path):
     gif_frames = []
     try:
         while True:
-            gif_frames.append(gif_image.copy())
-            gif_image.tk.call(gif_image, "configure", "-format", f"gif -index {len(gif_frames)}")
+            gif_frames.append(tk.PhotoImage(file=path, format=f"gif -index {len(gif_frames)}"))
     except tk.TclError:
         pass
     return gif_frames
 
 
-def create_gui(mounts, base_destination):
+def get_gif_frames():
+    """
+    Return the activity gif frames from the local cache. On the first run the
+    gif is downloaded in the background and an empty list is returned.
+    """
+    if os.path.exists(GIF_CACHE_PATH):
+        return load_gif_frames(GIF_CACHE_PATH)
+    threading.Thread(target=_download_and_cache_gif, daemon=True).start()
+    return []
+
+
+def load_downloaded_gif(ctx: Context):
+    """
+    Poll from the mainloop until the background download finishes, then load
+    the frames into the context. Does nothing if the gif came from the cache.
+    """
+    if ctx.gif_frames:
+        return
+    if not gif_downloaded.is_set():
+        ctx.root.after(100, load_downloaded_gif, ctx)
+    elif os.path.exists(GIF_CACHE_PATH):
+        ctx.gif_frames = load_gif_frames(GIF_CACHE_PATH)
+
+
+def animate_gif(ctx: Context, i=0):
+    # Runs on the mainloop, rescheduling itself until the copy thread sets stop_animation
+    if ctx.stop_animation.is_set():
+        ctx.activity_label.config(image="")
+        return
+    if ctx.gif_frames:
+        ctx.activity_label.config(image=ctx.gif_frames[i % len(ctx.gif_frames)])
+    ctx.root.after(100, animate_gif, ctx, i + 1)
+
+
+def create_gui(mounts, base_destination, progress_bar=False, native_copy=False):
     root = tk.Tk()
-    root.geometry("800x600")
+    root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
 
     root.title("Select Mount Points")
     current_file_var = tk.StringVar(value="No file being copied")
@@ -242,6 +839,12 @@ def create_gui(mounts, base_destination):
     destination_entry = ttk.Entry(root, textvariable=destination_var, width=50)
     destination_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=10, pady=10)
 
+    progress = None
+    if progress_bar:
+        progress = Progress(var=tk.IntVar(value=0))
+        progress_widget = ttk.Progressbar(root, variable=progress.var, maximum=100, length=400)
+        progress_widget.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), padx=10, pady=10)
+
     ctx = Context(
         mount_point=None,
         root=root,
@@ -250,15 +853,11 @@ def create_gui(mounts, base_destination):
         gif_frames=gif_frames,
         stop_animation=stop_animation,
         activity_label=activity_label,
+        progress=progress,
+        native_copy=native_copy,
     )
 
-    def animate_gif(stop_animation):
-        for frame in itertools.cycle(ctx.gif_frames):
-            if stop_animation.is_set():
-                break
-            ctx.activity_label.config(image=frame)
-            ctx.root.update_idletasks()
-            ctx.root.after(100)
+    root.after(100, load_downloaded_gif, ctx)
 
     def on_select():
         ctx.base_destination = destination_var.get()
@@ -269,7 +868,8 @@ def create_gui(mounts, base_destination):
         # print(selected_mounts)
         if selected_mounts:
             os.makedirs(ctx.base_destination, exist_ok=True)
-            threading.Thread(target=animate_gif, args=(stop_animation,)).start()
+            stop_animation.clear()
+            root.after(0, animate_gif, ctx)
             threading.Thread(
                 target=copy_files,
                 args=(ctx, selected_mounts),
@@ -292,6 +892,7 @@ def create_gui(mounts, base_destination):
             root.quit()
             for device in selected_mounts:
                 format_sd_card(device)
+            log_handler.flush()
 
     # frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
 
@@ -313,10 +914,9 @@ def create_gui(mounts, base_destination):
     button_format = ttk.Button(frame, text="Format Mounts", command=on_format)
     button_format.grid(sticky=tk.W)
 
-    # Center the window on the screen
-    root.update_idletasks()
-    window_width = root.winfo_width()
-    window_height = root.winfo_height()
+    # Center the window on the screen; the size is fixed, so no layout pass is needed to measure it
+    window_width = WINDOW_WIDTH
+    window_height = WINDOW_HEIGHT
     screen_width = root.winfo_screenwidth()
     screen_height = root.winfo_screenheight()
     position_top = int(screen_height / 2 - window_height / 2)
@@ -342,11 +942,18 @@ def signal_handler(sig, frame):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Copy the contents of SD cards")
+    parser.add_argument("--progress-bar", action="store_true", help="show a progress bar over all selected cards")
+    parser.add_argument(
+        "--native-copy",
+        action="store_true",
+        help="copy with cp/ditto/robocopy instead of the built-in copier",
+    )
+    args = parser.parse_args()
     signal.signal(signal.SIGINT, signal_handler)
     mounts = get_mounts()
-    # mounts = [m for m in mounts if "/Volumes" in m["mount_point"] and "/System/Volumes" not in m["mount_point"]]
     print(mounts)
     mounts = [m for m in mounts if m["device"] != "C"]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_destination = f"./data-{timestamp}"
-    create_gui(mounts, base_destination)
+    create_gui(mounts, base_destination, progress_bar=args.progress_bar, native_copy=args.native_copy)